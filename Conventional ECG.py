@@ -1,43 +1,95 @@
 import numpy as np
-from typing import Dict, List, Union
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, List, Mapping, Tuple, Union
 import json
+import textwrap
+from utils_numba import _av_kernel, _rr_std
+
+# Column order of the (N, 12) lead matrices used by the batch API
+LEADS = ('I', 'II', 'III', 'aVR', 'aVL', 'aVF',
+         'V1', 'V2', 'V3', 'V4', 'V5', 'V6')
+LEAD_IDX = {lead: i for i, lead in enumerate(LEADS)}
+
+# ST elevation threshold per lead (mV); unknown leads fall back to the limb value
+_LIMB = 0.1
+_PREC = 0.2
+THRESHOLD_BY_LEAD = {l: _LIMB for l in ('I', 'II', 'III', 'aVR', 'aVL', 'aVF')}
+THRESHOLD_BY_LEAD.update({f'V{i}': _PREC for i in range(1, 10)})
+
+# Spellings of the sex field (case-insensitive) that select the female Cornell
+# threshold; anything else, including missing or unrecognized values, is male
+_FEMALE = ('F', 'FEMALE')
+
+
+def _is_male(sex) -> bool:
+    return not (isinstance(sex, str) and sex.strip().upper() in _FEMALE)
+
+# Bit position of each lead in the single-ECG elevated-lead mask
+LEAD_BIT = {lead: 1 << i for i, lead in enumerate(
+    ('I', 'II', 'III', 'aVR', 'aVL', 'aVF',
+     'V1', 'V2', 'V3', 'V4', 'V5', 'V6', 'V7', 'V8', 'V9'))}
+
+# Bundle branch block lookup for the batch path, indexed by
+# (QRS >= partial) << 2 | (QRS >= complete and net V1+V2 < 0) << 1 | (net V1+V2 > 0)
+# Index 7 is unreachable (net V1+V2 cannot be both negative and positive)
+_BLOCK_ARR = np.array((None, None, None, None, 'IVCD', 'RBBB', 'LBBB', 'RBBB'), dtype=object)
 
 class CardiacDiagnosis:
-    def __init__(self):
-        # Threshold constants
-        self.ST_ELEV_THRESHOLDS = {
-            'limb': 0.1,  # mV (I, II, III, aVR, aVL, aVF)
-            'precordial': 0.2,  # mV (V1-V6)
-        }
-        self.QRS_DURATION_THRESHOLDS = {
-            'normal': 110,
-            'partial_block': 120,
-            'complete_block': 150
-        }
-        self.HR_THRESHOLDS = {
-            'bradycardia': 60,
-            'tachycardia': 100
-        }
+    __slots__ = ()
+
+    # Threshold constants; ST elevation thresholds live in THRESHOLD_BY_LEAD
+    _QRS_NORMAL: ClassVar[int] = 110
+    _QRS_PARTIAL: ClassVar[int] = 120
+    _QRS_COMPLETE: ClassVar[int] = 150
+    _HR_BRADY: ClassVar[int] = 60
+    _HR_TACHY: ClassVar[int] = 100
+
+    # Read-only views kept for callers of the original threshold dicts
+    ST_ELEV_THRESHOLDS: ClassVar[Mapping[str, float]] = MappingProxyType({
+        'limb': _LIMB,  # mV (I, II, III, aVR, aVL, aVF)
+        'precordial': _PREC,  # mV (V1-V9)
+    })
+    QRS_DURATION_THRESHOLDS: ClassVar[Mapping[str, int]] = MappingProxyType({
+        'normal': _QRS_NORMAL,
+        'partial_block': _QRS_PARTIAL,
+        'complete_block': _QRS_COMPLETE
+    })
+    HR_THRESHOLDS: ClassVar[Mapping[str, int]] = MappingProxyType({
+        'bradycardia': _HR_BRADY,
+        'tachycardia': _HR_TACHY
+    })
+
+    # Contiguous lead groups used for STEMI localization, checked in order
+    _REGIONS = (
+        ('Anterior', ('V1', 'V2', 'V3', 'V4')),
+        ('Inferior', ('II', 'III', 'aVF')),
+        ('Lateral', ('I', 'aVL', 'V5', 'V6')),
+        ('Posterior', ('V7', 'V8', 'V9')),
+    )
+    _REGION_MASKS = tuple(
+        (region, leads, sum(LEAD_BIT[lead] for lead in leads))
+        for region, leads in _REGIONS
+    )
+    # Batch counterparts in LEADS column order; posterior leads (V7-V9) are
+    # not part of the 12-lead matrix, so that row is all zeros
+    _ST_THRESHOLD_ROW = np.array([THRESHOLD_BY_LEAD[lead] for lead in LEADS])
+    _REGIONS_MASK = np.array(
+        [[lead in leads for lead in LEADS] for _, leads in _REGIONS],
+        dtype=np.int32
+    )
 
     def analyze_st_segment(self, st_levels: Dict[str, float]) -> Dict:
-        regions = {
-            'Anterior': ['V1', 'V2', 'V3', 'V4'],
-            'Inferior': ['II', 'III', 'aVF'],
-            'Lateral': ['I', 'aVL', 'V5', 'V6'],
-            'Posterior': ['V7', 'V8', 'V9'],
-        }
-        elevated_leads = []
+        elev_mask = 0
         st_depression = False
         for lead, value in st_levels.items():
-            threshold = self.ST_ELEV_THRESHOLDS['precordial'] if lead.startswith('V') else self.ST_ELEV_THRESHOLDS['limb']
-            if value > threshold:
-                elevated_leads.append(lead)
+            if value > THRESHOLD_BY_LEAD.get(lead, _LIMB):
+                elev_mask |= LEAD_BIT.get(lead, 0)
             elif value < -0.05:
                 st_depression = True
         localization = None
-        for region, leads in regions.items():
-            region_elev = [lead for lead in leads if lead in elevated_leads]
-            if len(region_elev) >= 2:
+        for region, leads, mask in self._REGION_MASKS:
+            if (elev_mask & mask).bit_count() >= 2:
+                region_elev = [lead for lead in leads if elev_mask & LEAD_BIT[lead]]
                 localization = {
                     'region': region,
                     'leads': region_elev,
@@ -54,24 +106,14 @@ class CardiacDiagnosis:
                         qrs_duration: float,
                         qrs_voltages: Dict[str, float]) -> Union[str, None]:
         """Diagnose bundle branch blocks using net QRS voltage in V1/V2"""
-        if qrs_duration < self.QRS_DURATION_THRESHOLDS['partial_block']:
+        if qrs_duration < self._QRS_PARTIAL:
             return None
         net_sum = qrs_voltages.get('V1', 0) + qrs_voltages.get('V2', 0)
-        rbbb = (
-            qrs_duration >= self.QRS_DURATION_THRESHOLDS['partial_block'] and
-            net_sum > 0
-        )
-        lbbb = (
-            qrs_duration >= self.QRS_DURATION_THRESHOLDS['complete_block'] and
-            net_sum < 0
-        )
-        if rbbb:
+        if net_sum > 0:
             return 'RBBB'
-        elif lbbb:
+        elif net_sum < 0 and qrs_duration >= self._QRS_COMPLETE:
             return 'LBBB'
-        elif qrs_duration >= self.QRS_DURATION_THRESHOLDS['partial_block']:
-            return 'IVCD'
-        return None
+        return 'IVCD'
 
     def analyze_av_conduction(self, p_wave_count: int, qrs_count: int,
                                pr_intervals: List[float]) -> Dict:
@@ -83,25 +125,26 @@ class CardiacDiagnosis:
             'classification': 'Normal conduction'
         }
         if beat_diff > 0:
+            pr_arr = np.asarray(pr_intervals, dtype=np.float64)
+            pr_std, progressive, last_lt_first, dissociated = _av_kernel(pr_arr)
             if len(pr_intervals) >= 3:
-                pr_deltas = np.diff(pr_intervals)
-                if all(d > 0 for d in pr_deltas[:-1]) and pr_intervals[-1] < pr_intervals[0]:
+                if progressive and last_lt_first:
                     result.update({
                         'classification': 'Mobitz I (Wenckebach)',
                         'pattern': f"{len(pr_intervals)+1}:{len(pr_intervals)}",
                         'pr_progression': [f"{x}ms" for x in pr_intervals]
                     })
                     return result
-            if len(pr_intervals) >= 2 and np.std(pr_intervals) < 5:
+            if len(pr_intervals) >= 2 and pr_std < 5:
                 result.update({
                     'classification': 'Mobitz II',
                     'pattern': f"{beat_diff+1}:1",
-                    'pr_variation': f"{np.std(pr_intervals):.1f}ms"
+                    'pr_variation': f"{pr_std:.1f}ms"
                 })
                 return result
             if beat_diff >= 2:
                 result['classification'] = 'High-grade AV block'
-                if beat_diff >= 3 and all(pr < 120 or pr > 240 for pr in pr_intervals):
+                if beat_diff >= 3 and dissociated:
                     result.update({
                         'classification': '3rd degree AV block',
                         'atrial_rate': p_wave_count,
@@ -109,32 +152,37 @@ class CardiacDiagnosis:
                     })
         return result
 
-    def diagnose_hypertrophy(self, qrs_voltages: Dict[str, float]) -> Union[str, None]:
-        cornell = (qrs_voltages.get('aVL', 0) + qrs_voltages.get('V3', 0)) > 2.8 or \
-                  (qrs_voltages.get('aVL', 0) + qrs_voltages.get('V3', 0)) > 2.0
-        sokolow = (qrs_voltages.get('V1', 0) + max(qrs_voltages.get('V5', 0), qrs_voltages.get('V6', 0))) > 3.5
+    def diagnose_hypertrophy(self, qrs_voltages: Dict[str, float],
+                             sex: Union[str, None] = 'M') -> Union[str, None]:
+        """Cornell voltage threshold is 2.8 mV for men and 2.0 mV for women"""
+        avl_v3 = qrs_voltages.get('aVL', 0.0) + qrs_voltages.get('V3', 0.0)
+        cornell = avl_v3 > (2.8 if _is_male(sex) else 2.0)
+        v1 = qrs_voltages.get('V1', 0.0)
+        v5 = qrs_voltages.get('V5', 0.0)
+        v6 = qrs_voltages.get('V6', 0.0)
+        sokolow = v1 + (v5 if v5 > v6 else v6) > 3.5
         if cornell or sokolow:
             return 'LVH'
-        elif qrs_voltages.get('V1', 0) > 0.7 and qrs_voltages.get('V6', 0) < 0.3:
+        elif v1 > 0.7 and v6 < 0.3:
             return 'RVH'
         return None
 
     def analyze_rhythm(self, hr: float, rr_intervals: List[float],
                       p_wave_presence: bool) -> str:
-        rr_var = np.std(rr_intervals) if len(rr_intervals) > 1 else 0
-        if hr < self.HR_THRESHOLDS['bradycardia']:
+        rr_var = _rr_std(np.asarray(rr_intervals, dtype=np.float64)) if len(rr_intervals) > 1 else 0
+        if hr < self._HR_BRADY:
             if not p_wave_presence:
                 return 'Junctional bradycardia'
             elif rr_var > 100:
                 return 'Sinus arrhythmia'
             return 'Sinus bradycardia'
-        elif hr > self.HR_THRESHOLDS['tachycardia']:
+        elif hr > self._HR_TACHY:
             if rr_var > 50:
                 return 'Atrial fibrillation'
             elif p_wave_presence:
                 return 'Sinus tachycardia'
             return 'SVT'
-        if 60 <= hr <= 100 and rr_var < 30 and p_wave_presence:
+        if self._HR_BRADY <= hr <= self._HR_TACHY and rr_var < 30 and p_wave_presence:
             return 'Normal sinus rhythm'
         return 'Unclassified rhythm'
 
@@ -153,7 +201,10 @@ class CardiacDiagnosis:
         )
         if block_dx:
             results['conduction_abnormality'] = block_dx
-        hypertrophy = self.diagnose_hypertrophy(ecg_parameters['qrs_voltages'])
+        hypertrophy = self.diagnose_hypertrophy(
+            ecg_parameters['qrs_voltages'],
+            ecg_parameters.get('sex')
+        )
         if hypertrophy:
             results['hypertrophy'] = hypertrophy
         results['rhythm'] = self.analyze_rhythm(
@@ -163,6 +214,242 @@ class CardiacDiagnosis:
         )
         return results
 
+    # Batch API: structure-of-arrays inputs, one row per patient and one
+    # column per lead in LEADS order. Missing leads should be filled with 0.
+    # Inputs are compared in float64, the precision of the single-ECG path.
+
+    def analyze_st_segment_batch(self, st: np.ndarray) -> Dict:
+        """Vectorized analyze_st_segment over an (N, 12) matrix of ST levels"""
+        st = np.asarray(st, dtype=np.float64)
+        elevated = st > self._ST_THRESHOLD_ROW
+        st_depression = (st < -0.05).any(axis=1)
+        region_hit = (elevated.astype(np.int32) @ self._REGIONS_MASK.T) >= 2
+        st_elevation = region_hit.any(axis=1)
+        region = np.where(st_elevation, region_hit.argmax(axis=1), -1)
+        region_leads = elevated & self._REGIONS_MASK[np.maximum(region, 0)].astype(bool)
+        max_st_elev = np.where(
+            st_elevation,
+            np.where(region_leads, st, -np.inf).max(axis=1),
+            np.nan
+        )
+        return {
+            'st_elevation': st_elevation,
+            'region': region,
+            'region_leads': region_leads,
+            'max_st_elev': max_st_elev,
+            'st_depression': st_depression
+        }
+
+    def diagnose_blocks_batch(self, qrs_duration: np.ndarray,
+                              qrs_voltages: np.ndarray) -> np.ndarray:
+        """Vectorized diagnose_blocks; returns an object array of labels/None"""
+        dur = np.asarray(qrs_duration, dtype=np.float64)
+        v = np.asarray(qrs_voltages, dtype=np.float64)
+        net_sum = v[:, LEAD_IDX['V1']] + v[:, LEAD_IDX['V2']]
+        idx = (
+            ((dur >= self._QRS_PARTIAL).astype(np.uint8) << 2) |
+            (((dur >= self._QRS_COMPLETE) & (net_sum < 0)).astype(np.uint8) << 1) |
+            (net_sum > 0).astype(np.uint8)
+        )
+        return np.take(_BLOCK_ARR, idx)
+
+    def diagnose_hypertrophy_batch(self, qrs_voltages: np.ndarray,
+                                   sex: Union[np.ndarray, None] = None) -> np.ndarray:
+        """Vectorized diagnose_hypertrophy; returns an object array of labels/None"""
+        # Sums and thresholds are both float64, the precision of the scalar path
+        v = np.asarray(qrs_voltages, dtype=np.float64)
+        v1 = v[:, LEAD_IDX['V1']]
+        v6 = v[:, LEAD_IDX['V6']]
+        if sex is None:
+            male = np.ones(len(v), dtype=bool)
+        else:
+            keys = np.char.upper(np.char.strip(np.asarray(sex, dtype=object).astype(str)))
+            male = ~np.isin(keys, _FEMALE)
+        avl_v3 = v[:, LEAD_IDX['aVL']] + v[:, LEAD_IDX['V3']]
+        cornell = avl_v3 > np.where(male, 2.8, 2.0)
+        sokolow = (v1 + np.maximum(v[:, LEAD_IDX['V5']], v6)) > 3.5
+        rvh = (v1 > 0.7) & (v6 < 0.3)
+        return np.where(cornell | sokolow, 'LVH', np.where(rvh, 'RVH', None))
+
+    def analyze_av_conduction_batch(self, p_wave_count: np.ndarray,
+                                    qrs_count: np.ndarray,
+                                    pr_intervals: np.ndarray) -> Dict:
+        """Vectorized analyze_av_conduction over (N,) beat counts and (N, K) PR intervals"""
+        p_count = np.asarray(p_wave_count)
+        beat_diff = p_count - np.asarray(qrs_count)
+        pr_arr = np.asarray(pr_intervals, dtype=np.float64)
+        if pr_arr.ndim != 2 or len(pr_arr) != len(beat_diff):
+            raise ValueError(
+                f"pr_intervals must be an (N, K) matrix with one row per patient, "
+                f"got shape {pr_arr.shape} for {len(beat_diff)} patients"
+            )
+        k = pr_arr.shape[1]
+        dropped = beat_diff > 0
+        if k >= 3:
+            progressive = (np.diff(pr_arr, axis=1)[:, :-1] > 0).all(axis=1)
+            mobitz_1 = progressive & (pr_arr[:, -1] < pr_arr[:, 0])
+        else:
+            mobitz_1 = np.zeros(len(beat_diff), dtype=bool)
+        if k >= 2:
+            mobitz_2 = pr_arr.std(axis=1) < 5
+        else:
+            mobitz_2 = np.zeros(len(beat_diff), dtype=bool)
+        outside = (pr_arr < 120.0) | (pr_arr > 240.0)
+        classification = np.select(
+            [dropped & mobitz_1, dropped & mobitz_2,
+             (beat_diff >= 3) & outside.all(axis=1), beat_diff >= 2],
+            ['Mobitz I (Wenckebach)', 'Mobitz II',
+             '3rd degree AV block', 'High-grade AV block'],
+            default='Normal conduction'
+        )
+        return {
+            'missing_beats': np.maximum(beat_diff, 0),
+            'classification': classification
+        }
+
+    def analyze_rhythm_batch(self, hr: np.ndarray, rr_intervals: np.ndarray,
+                             p_wave_presence: np.ndarray) -> np.ndarray:
+        """Vectorized analyze_rhythm over (N,) rates and (N, K) RR intervals"""
+        hr = np.asarray(hr, dtype=np.float64)
+        rr = np.asarray(rr_intervals, dtype=np.float64)
+        p = np.asarray(p_wave_presence, dtype=bool)
+        rr_var = rr.std(axis=1) if rr.shape[1] > 1 else np.zeros(len(hr))
+        brady = hr < self._HR_BRADY
+        tachy = hr > self._HR_TACHY
+        return np.select(
+            [brady & ~p, brady & (rr_var > 100), brady,
+             tachy & (rr_var > 50), tachy & p, tachy,
+             (hr >= self._HR_BRADY) & (hr <= self._HR_TACHY) & (rr_var < 30) & p],
+            ['Junctional bradycardia', 'Sinus arrhythmia', 'Sinus bradycardia',
+             'Atrial fibrillation', 'Sinus tachycardia', 'SVT',
+             'Normal sinus rhythm'],
+            default='Unclassified rhythm'
+        )
+
+    def full_analysis_batch(self, st_levels: np.ndarray,
+                            qrs_voltages: np.ndarray,
+                            qrs_duration: np.ndarray,
+                            heart_rate: np.ndarray,
+                            rr_intervals: np.ndarray,
+                            p_wave_presence: Union[np.ndarray, None] = None,
+                            sex: Union[np.ndarray, None] = None,
+                            p_wave_count: Union[np.ndarray, None] = None,
+                            qrs_count: Union[np.ndarray, None] = None,
+                            pr_intervals: Union[np.ndarray, None] = None) -> Dict:
+        """Screen N ECGs at once; every result is an array with one entry per patient"""
+        if p_wave_presence is None:
+            p_wave_presence = np.ones(len(heart_rate), dtype=bool)
+        results = {}
+        results['st_analysis'] = self.analyze_st_segment_batch(st_levels)
+        av_inputs = (p_wave_count, qrs_count, pr_intervals)
+        if any(x is not None for x in av_inputs) and any(x is None for x in av_inputs):
+            raise ValueError("p_wave_count, qrs_count and pr_intervals must be given together")
+        if p_wave_count is not None:
+            results['av_conduction'] = self.analyze_av_conduction_batch(
+                p_wave_count, qrs_count, pr_intervals
+            )
+        results['conduction_abnormality'] = self.diagnose_blocks_batch(qrs_duration, qrs_voltages)
+        results['hypertrophy'] = self.diagnose_hypertrophy_batch(qrs_voltages, sex)
+        results['rhythm'] = self.analyze_rhythm_batch(heart_rate, rr_intervals, p_wave_presence)
+        return results
+
+
+# Region names indexed by the 'region' array of analyze_st_segment_batch
+REGION_NAMES = tuple(region for region, _ in CardiacDiagnosis._REGIONS)
+
+_COMPILED_ANALYZERS: Dict[Tuple[str, ...], Callable] = {}
+
+_ANALYZER_TEMPLATE = textwrap.dedent("""\
+    def analyze(st, qrs, qrs_duration, sex='M'):
+    {elevated}
+        st_depression = bool({depression})
+    {localization}
+        results = {{'st_analysis': {{
+            'st_elevation': bool(localization),
+            'localization': localization,
+            'st_depression': st_depression
+        }}}}
+        if qrs_duration >= {qrs_partial!r}:
+            net_sum = {v1} + {v2}
+            if net_sum > 0:
+                results['conduction_abnormality'] = 'RBBB'
+            elif net_sum < 0 and qrs_duration >= {qrs_complete!r}:
+                results['conduction_abnormality'] = 'LBBB'
+            else:
+                results['conduction_abnormality'] = 'IVCD'
+        v1 = {v1}
+        v5 = {v5}
+        v6 = {v6}
+        if {avl} + {v3} > (2.8 if _is_male(sex) else 2.0) or v1 + (v5 if v5 > v6 else v6) > 3.5:
+            results['hypertrophy'] = 'LVH'
+        elif v1 > 0.7 and v6 < 0.3:
+            results['hypertrophy'] = 'RVH'
+        return results
+""")
+
+
+def compile_analyzer(leads: Tuple[str, ...] = LEADS) -> Callable:
+    """Build an analyzer specialized for a fixed lead order.
+
+    The returned ``analyze(st, qrs, qrs_duration, sex='M')`` takes ST levels
+    and QRS voltages as sequences in ``leads`` order and returns the
+    lead-dependent part of ``CardiacDiagnosis.full_analysis`` (ST analysis,
+    conduction abnormality and hypertrophy). Lead indices, thresholds and
+    region checks are baked into generated source, so no per-call dict
+    lookups remain. Specializations are cached per lead order.
+    """
+    leads = tuple(leads)
+    analyze = _COMPILED_ANALYZERS.get(leads)
+    if analyze is not None:
+        return analyze
+    idx = {lead: i for i, lead in enumerate(leads)}
+
+    def qrs(lead):
+        return f'qrs[{idx[lead]}]' if lead in idx else '0.0'
+
+    elevated = '\n'.join(
+        f'    e{i} = st[{i}] > {THRESHOLD_BY_LEAD.get(lead, _LIMB)!r}'
+        for i, lead in enumerate(leads)
+    )
+    depression = ' or '.join(f'st[{i}] < -0.05' for i in range(len(leads))) or 'False'
+    branches = []
+    for region, region_leads in CardiacDiagnosis._REGIONS:
+        present = [(lead, idx[lead]) for lead in region_leads if lead in idx]
+        if len(present) < 2:
+            continue
+        flags = ', '.join(f'({lead!r}, e{i})' for lead, i in present)
+        values = ', '.join(f'(st[{i}], e{i})' for _, i in present)
+        # Unrolled "at least two elevated" test; summing the flags would be a
+        # logical OR when st holds NumPy scalars (np.bool_ + np.bool_)
+        pairs = ' or '.join(
+            f'(e{i} and e{j})' for a, (_, i) in enumerate(present) for _, j in present[a + 1:]
+        )
+        branches.append(
+            f"    {'elif' if branches else 'if'} {pairs}:\n"
+            f"        localization = {{\n"
+            f"            'region': {region!r},\n"
+            f"            'leads': [lead for lead, e in ({flags},) if e],\n"
+            f"            'max_st_elev': max(v for v, e in ({values},) if e)\n"
+            f"        }}"
+        )
+    if branches:
+        branches.append('    else:\n        localization = None')
+    else:
+        branches.append('    localization = None')
+    source = _ANALYZER_TEMPLATE.format(
+        elevated=elevated or '    pass',
+        depression=depression,
+        localization='\n'.join(branches),
+        qrs_partial=CardiacDiagnosis._QRS_PARTIAL,
+        qrs_complete=CardiacDiagnosis._QRS_COMPLETE,
+        v1=qrs('V1'), v2=qrs('V2'), v3=qrs('V3'),
+        v5=qrs('V5'), v6=qrs('V6'), avl=qrs('aVL')
+    )
+    namespace = {'_is_male': _is_male}
+    exec(compile(source, f'<analyzer {leads}>', 'exec'), namespace)
+    analyze = _COMPILED_ANALYZERS[leads] = namespace['analyze']
+    return analyze
+
 
 # Example Usage
 if __name__ == "__main__":
@@ -186,7 +473,34 @@ if __name__ == "__main__":
         'qrs_duration': 130,
         'st_levels': {'V1': 0.1, 'V2': 0.15, 'V3': 0.05, 'II': 0.08, 'III': 0.1},
         'qrs_voltages': {'V1': 0.8, 'V2': 0.5, 'V5': 2.0, 'V6': 2.1},
-        'p_wave_presence': True
+        'p_wave_presence': True,
+        'sex': 'M'
     }
     result = analyzer.full_analysis(sample_ecg)
     print("\nFull Analysis:\n", json.dumps(result, indent=2))
+
+    # Batch analysis example: one row per patient, columns in LEADS order
+    def to_row(values: Dict[str, float]) -> List[float]:
+        return [values.get(lead, 0.0) for lead in LEADS]
+
+    batch = analyzer.full_analysis_batch(
+        st_levels=np.array([to_row(sample_ecg['st_levels']),
+                            to_row({'V1': 0.3, 'V2': 0.4, 'V3': 0.25})]),
+        qrs_voltages=np.array([to_row(sample_ecg['qrs_voltages']),
+                               to_row(ecg_lbbb['qrs_voltages'])]),
+        qrs_duration=np.array([130, 160]),
+        heart_rate=np.array([75, 110]),
+        rr_intervals=np.array([sample_ecg['rr_intervals'], [540, 550, 545, 548]])
+    )
+    print("\nBatch Analysis:")
+    print("  ST elevation:", batch['st_analysis']['st_elevation'].tolist())
+    print("  Conduction:", batch['conduction_abnormality'].tolist())
+    print("  Hypertrophy:", batch['hypertrophy'].tolist())
+    print("  Rhythm:", batch['rhythm'].tolist())
+
+    # Specialized analyzer for a fixed 12-lead export order
+    analyze = compile_analyzer(LEADS)
+    fixed = analyze(tuple(to_row(sample_ecg['st_levels'])),
+                    tuple(to_row(sample_ecg['qrs_voltages'])),
+                    sample_ecg['qrs_duration'])
+    print("\nCompiled Analyzer:\n", json.dumps(fixed, indent=2))
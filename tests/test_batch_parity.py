@@ -0,0 +1,161 @@
+"""Check that the batch API agrees with the single-ECG path"""
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+_spec = importlib.util.spec_from_file_location(
+    'conventional_ecg', os.path.join(ROOT, 'Conventional ECG.py')
+)
+ecg = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ecg)
+
+LEADS = ecg.LEADS
+LEAD_IDX = ecg.LEAD_IDX
+analyzer = ecg.CardiacDiagnosis()
+
+
+def _grid(n=5000, seed=0):
+    """Random ECGs on a 0.05 mV grid around the thresholds, plus known edge cases"""
+    rng = np.random.default_rng(seed)
+    st = np.round(rng.choice(np.arange(-0.15, 0.35, 0.05), size=(n, len(LEADS))), 2)
+    st[0, [LEAD_IDX['II'], LEAD_IDX['III']]] = 0.1000000001
+    qrs = np.round(rng.choice(np.arange(-0.5, 3.05, 0.05), size=(n, len(LEADS))), 2)
+    qrs[1, [LEAD_IDX['aVL'], LEAD_IDX['V3']]] = (-0.1, 2.9)
+    qrs[2, [LEAD_IDX['aVL'], LEAD_IDX['V3']]] = (1.2, 1.6)
+    return {
+        'st_levels': st,
+        'qrs_voltages': qrs,
+        'qrs_duration': rng.choice([100, 110, 119, 120, 130, 149, 150, 160], size=n),
+        'heart_rate': rng.choice([45, 59, 60, 75, 100, 101, 130], size=n),
+        'rr_intervals': rng.choice([500, 600, 700, 800, 1000], size=(n, 4)),
+        'p_wave_presence': rng.random(n) > 0.2,
+        'sex': rng.choice(np.array(['M', 'F', 'm', ' f ', 'female', 'Male', 'O', 'U',
+                                    '', None, np.nan], dtype=object), size=n),
+    }
+
+
+def _single(grid, i):
+    return analyzer.full_analysis({
+        'st_levels': dict(zip(LEADS, grid['st_levels'][i].tolist())),
+        'qrs_voltages': dict(zip(LEADS, grid['qrs_voltages'][i].tolist())),
+        'qrs_duration': int(grid['qrs_duration'][i]),
+        'heart_rate': int(grid['heart_rate'][i]),
+        'rr_intervals': grid['rr_intervals'][i].tolist(),
+        'p_wave_presence': bool(grid['p_wave_presence'][i]),
+        'sex': grid['sex'][i]
+    })
+
+
+def test_full_analysis_batch_matches_full_analysis():
+    grid = _grid()
+    batch = analyzer.full_analysis_batch(**grid)
+    st_batch = batch['st_analysis']
+    for i in range(len(grid['heart_rate'])):
+        single = _single(grid, i)
+        st_single = single['st_analysis']
+        assert st_single['st_elevation'] == st_batch['st_elevation'][i], i
+        assert st_single['st_depression'] == st_batch['st_depression'][i], i
+        if st_single['localization']:
+            region = ecg.REGION_NAMES[st_batch['region'][i]]
+            assert st_single['localization']['region'] == region, i
+            assert st_single['localization']['max_st_elev'] == st_batch['max_st_elev'][i], i
+        assert single.get('conduction_abnormality') == batch['conduction_abnormality'][i], i
+        assert single.get('hypertrophy') == batch['hypertrophy'][i], i
+        assert single['rhythm'] == batch['rhythm'][i], i
+
+
+def test_interval_std_matches_numpy_at_thresholds():
+    # Non-integer intervals whose standard deviation sits on a threshold
+    rr = [250.3, 125.3, 125.3, 125.3, 125.3]
+    assert np.std(rr) == 50.0
+    assert analyzer.analyze_rhythm(130, rr, True) == 'Sinus tachycardia'
+    assert analyzer.analyze_rhythm_batch([130], [rr], [True])[0] == 'Sinus tachycardia'
+    pr = [715.0, 712.8, 721.4, 711.2, 724.1]
+    assert analyzer.analyze_av_conduction(6, 4, pr)['classification'] == 'High-grade AV block'
+    batch = analyzer.analyze_av_conduction_batch([6], [4], [pr])
+    assert batch['classification'][0] == 'High-grade AV block'
+
+
+def test_rhythm_batch_matches_single_on_fractional_intervals():
+    rng = np.random.default_rng(1)
+    n = 5000
+    hr = rng.choice([45, 75, 130], size=n)
+    rr = np.round(rng.uniform(400, 1200, size=(n, 5)), 1)
+    p = rng.random(n) > 0.2
+    batch = analyzer.analyze_rhythm_batch(hr, rr, p)
+    for i in range(n):
+        single = analyzer.analyze_rhythm(int(hr[i]), rr[i].tolist(), bool(p[i]))
+        assert single == batch[i], i
+
+
+def test_compiled_analyzer_matches_full_analysis_on_ndarray_rows():
+    grid = _grid(n=2000, seed=2)
+    analyze = ecg.compile_analyzer()
+    for i in range(len(grid['heart_rate'])):
+        single = _single(grid, i)
+        expected = {k: single[k] for k in ('st_analysis', 'conduction_abnormality', 'hypertrophy')
+                    if k in single}
+        args = (grid['qrs_duration'][i], grid['sex'][i])
+        st_row, qrs_row = grid['st_levels'][i], grid['qrs_voltages'][i]
+        assert analyze(st_row, qrs_row, *args) == expected, i
+        assert analyze(tuple(st_row), tuple(qrs_row), *args) == expected, i
+        assert analyze(tuple(st_row.tolist()), tuple(qrs_row.tolist()), *args) == expected, i
+
+
+def test_compiled_analyzer_localizes_anterior_stemi_from_ndarray():
+    st = np.zeros(len(LEADS))
+    st[[LEAD_IDX['V1'], LEAD_IDX['V2'], LEAD_IDX['V3']]] = 0.3
+    result = ecg.compile_analyzer()(st, np.zeros(len(LEADS)), 100)
+    assert result['st_analysis']['st_elevation'] is True
+    assert result['st_analysis']['localization']['region'] == 'Anterior'
+    assert result['st_analysis']['localization']['leads'] == ['V1', 'V2', 'V3']
+
+
+def test_unrecognized_or_missing_sex_uses_male_cornell_threshold():
+    # aVL + V3 = 2.5 mV: LVH by the female threshold only
+    voltages = {'aVL': 1.0, 'V3': 1.5}
+    row = np.array([[voltages.get(lead, 0.0) for lead in LEADS]] * 7)
+    sexes = ['O', 'U', None, '', np.nan, 'F', 'female']
+    expected = [None] * 5 + ['LVH', 'LVH']
+    assert analyzer.diagnose_hypertrophy_batch(row, np.array(sexes, dtype=object)).tolist() == expected
+    for sex, dx in zip(sexes, expected):
+        assert analyzer.diagnose_hypertrophy(voltages, sex) == dx
+    result = analyzer.full_analysis({
+        'st_levels': {}, 'qrs_voltages': voltages, 'qrs_duration': 100,
+        'heart_rate': 75, 'rr_intervals': [800, 800], 'sex': 'O'
+    })
+    assert 'hypertrophy' not in result
+
+
+def test_av_conduction_batch_matches_single():
+    rng = np.random.default_rng(3)
+    n = 3000
+    pr_grid = np.array([100, 118, 120, 160, 161, 162, 163, 165, 200, 240, 250,
+                        715.0, 712.8, 721.4, 711.2, 724.1])
+    for k in range(6):
+        p_count = rng.integers(2, 9, n)
+        qrs_count = rng.integers(1, 7, n)
+        pr = rng.choice(pr_grid, size=(n, k))
+        batch = analyzer.analyze_av_conduction_batch(p_count, qrs_count, pr)
+        for i in range(n):
+            single = analyzer.analyze_av_conduction(int(p_count[i]), int(qrs_count[i]), pr[i].tolist())
+            assert single['classification'] == batch['classification'][i], (k, i)
+            assert single['missing_beats'] == batch['missing_beats'][i], (k, i)
+
+
+def test_av_conduction_batch_rejects_incomplete_inputs():
+    grid = _grid(n=3)
+    with pytest.raises(ValueError):
+        analyzer.full_analysis_batch(**grid, p_wave_count=[4, 4, 4])
+    with pytest.raises(ValueError):
+        analyzer.analyze_av_conduction_batch([4, 4, 4], [3, 3, 3], [160, 170, 180])
+    result = analyzer.full_analysis_batch(**grid, p_wave_count=[4, 5, 6], qrs_count=[4, 4, 3],
+                                          pr_intervals=[[160, 160], [160, 161], [100, 250]])
+    assert result['av_conduction']['classification'].tolist() == [
+        'Normal conduction', 'Mobitz II', '3rd degree AV block'
+    ]
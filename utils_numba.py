@@ -0,0 +1,43 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _std(x):
+    n = x.shape[0]
+    if n == 0:
+        return 0.0
+    mean = 0.0
+    for i in range(n):
+        mean += x[i]
+    mean /= n
+    var = 0.0
+    for i in range(n):
+        d = x[i] - mean
+        var += d * d
+    return np.sqrt(var / n)
+
+
+@njit(cache=True)
+def _av_kernel(pr):
+    """Return (PR std, progressive PR lengthening, last PR < first PR,
+    every PR outside 120-240 ms) for an array of PR intervals"""
+    n = pr.shape[0]
+    # PR lengthens on every beat before the dropped one (last delta excluded)
+    monotonic_increasing = True
+    for i in range(n - 2):
+        if not pr[i + 1] > pr[i]:
+            monotonic_increasing = False
+            break
+    last_lt_first = n > 0 and pr[n - 1] < pr[0]
+    all_outside = True
+    for i in range(n):
+        if not (pr[i] < 120.0 or pr[i] > 240.0):
+            all_outside = False
+            break
+    return _std(pr), monotonic_increasing, last_lt_first, all_outside
+
+
+@njit(cache=True)
+def _rr_std(rr):
+    return _std(rr)